@@ -0,0 +1,7 @@
+# flake8_only_english/__main__.py
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
@@ -1,8 +1,35 @@
 # flake8_only_english/checker.py
 
 import ast
+import codecs
+import logging
+import os
+import time
 import tokenize
 
+from . import config, confusables
+
+LOG = logging.getLogger(__name__)
+
+# Messages are prebuilt so reporting a violation does not allocate them.
+NLE001_COMMENT = "NLE001 Non-English text in comment"
+NLE001_DOCSTRING = "NLE001 Non-English text in docstring"
+NLE002_STRING = "NLE002 Non-English text in string literal"
+NLE004_DEGRADED = ("NLE004 Non-English text in file too large for a full "
+                   "scan, skipped {}")
+
+# Tokens whose text is checked; all-ASCII tokens are skipped up front.
+TEXT_TOKENS = {tokenize.COMMENT, tokenize.STRING, tokenize.NAME}
+if hasattr(tokenize, "FSTRING_MIDDLE"):
+    TEXT_TOKENS.add(tokenize.FSTRING_MIDDLE)
+
+# The time budget is checked once per this many tokens or AST nodes, so
+# single-line files are cut short too.
+BUDGET_INTERVAL = 256
+
+# Degraded files are read in chunks of this size.
+CHUNK_SIZE = 64 * 1024
+
 
 class NonEnglishChecker:
     name = "flake8-only-english"
@@ -10,10 +37,19 @@ class NonEnglishChecker:
 
     nle_comments = True
     nle_strings = True
+    nle_homoglyphs = True
+    nle_time_budget_ms = 0
+    nle_max_bytes = 0
+
+    # Options given explicitly on the command line; these win over any
+    # per-directory pyproject.toml configuration.
+    nle_cli_options = frozenset()
 
     def __init__(self, tree, filename="(none)"):
         self.tree = tree
         self.filename = filename
+        self.degraded = None
+        self._deadline = None
 
     @classmethod
     def add_options(cls, parser):
@@ -41,49 +77,205 @@ class NonEnglishChecker:
             dest="nle_strings",
             help="Disable only-english detection in string literals (NLE002)."
         )
+        parser.add_option(
+            "--nle-homoglyphs",
+            action="store_true",
+            default=None,
+            help="Enable mixed-script confusable word detection (NLE003)."
+        )
+        parser.add_option(
+            "--no-nle-homoglyphs",
+            action="store_false",
+            dest="nle_homoglyphs",
+            help="Disable mixed-script confusable word detection (NLE003)."
+        )
+        parser.add_option(
+            "--nle-time-budget-ms",
+            type=int,
+            default=None,
+            help="Fall back to a single non-ASCII presence check (NLE004) "
+                 "once a file takes longer than this. 0 disables the budget."
+        )
+        parser.add_option(
+            "--nle-max-bytes",
+            type=int,
+            default=None,
+            help="Only check files larger than this for non-ASCII presence "
+                 "(NLE004). 0 disables the limit."
+        )
 
     @classmethod
     def parse_options(cls, options):
+        explicit = set()
         if options.nle_comments is not None:
             cls.nle_comments = options.nle_comments
+            explicit.add("nle_comments")
         if options.nle_strings is not None:
             cls.nle_strings = options.nle_strings
+            explicit.add("nle_strings")
+        if options.nle_homoglyphs is not None:
+            cls.nle_homoglyphs = options.nle_homoglyphs
+            explicit.add("nle_homoglyphs")
+        cls.nle_cli_options = frozenset(explicit)
+        if options.nle_time_budget_ms is not None:
+            cls.nle_time_budget_ms = cls._limit(
+                "--nle-time-budget-ms", options.nle_time_budget_ms)
+        if options.nle_max_bytes is not None:
+            cls.nle_max_bytes = cls._limit(
+                "--nle-max-bytes", options.nle_max_bytes)
+
+    @staticmethod
+    def _limit(flag, value):
+        # Negative limits would degrade every file; treat them as disabled.
+        if value < 0:
+            LOG.warning("%s=%s is negative, disabling it", flag, value)
+            return 0
+        return value
 
     def run(self):
         if self.tree is None:
             return
 
-        if self.nle_comments:
-            yield from self._check_comments()
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        for option, value in config.resolve(directory).items():
+            if option not in self.nle_cli_options:
+                setattr(self, option, value)
 
-        if self.nle_strings:
+        if not (self.nle_comments or self.nle_strings or self.nle_homoglyphs):
+            return
+
+        if self.nle_max_bytes:
+            size = os.path.getsize(self.filename)
+            if size > self.nle_max_bytes:
+                self._degrade(f"{size} bytes exceed --nle-max-bytes="
+                              f"{self.nle_max_bytes}")
+
+        if self.nle_time_budget_ms:
+            self._deadline = (time.monotonic()
+                              + self.nle_time_budget_ms / 1000)
+
+        if not self.degraded:
+            if self._deadline is None:
+                yield from self._scan()
+            else:
+                # Buffered, so a file that runs out of time reports only the
+                # NLE004 summary rather than a partial scan plus the summary.
+                results = list(self._scan())
+                if not self.degraded:
+                    yield from results
+
+        if self.degraded:
+            yield from self._check_presence()
+
+    def _scan(self):
+        if self.nle_comments or self.nle_homoglyphs:
+            yield from self._check_tokens()
+
+        if self.nle_strings and not self.degraded:
             yield from self._check_strings()
 
-    def _check_comments(self):
+    def _degrade(self, reason):
+        self.degraded = reason
+        LOG.warning("%s: %s, falling back to a non-ASCII presence check",
+                    self.filename, reason)
+
+    def _over_budget(self):
+        if time.monotonic() > self._deadline:
+            self._degrade(f"exceeded --nle-time-budget-ms="
+                          f"{self.nle_time_budget_ms}")
+            return True
+        return False
+
+    def _check_presence(self):
+        with open(self.filename, "rb") as f:
+            chunk = f.read(CHUNK_SIZE)
+            if chunk.startswith(codecs.BOM_UTF8):
+                chunk = chunk[len(codecs.BOM_UTF8):]
+            while chunk:
+                if not chunk.isascii():
+                    break
+                chunk = f.read(CHUNK_SIZE)
+            else:
+                return
+
+        skipped = [code for code, enabled in (
+            ("NLE001", self.nle_comments),
+            ("NLE002", self.nle_strings),
+            ("NLE003", self.nle_homoglyphs),
+        ) if enabled]
+        yield 1, 0, NLE004_DEGRADED.format(", ".join(skipped)), type(self)
+
+    def _check_tokens(self):
         with open(self.filename, "rb") as f:
             tokens = tokenize.tokenize(f.readline)
+            countdown = BUDGET_INTERVAL
             for token in tokens:
-                if token.type == tokenize.COMMENT:
-                    if self._contains_non_english(token.string):
+                if self._deadline is not None:
+                    countdown -= 1
+                    if not countdown:
+                        if self._over_budget():
+                            return
+                        countdown = BUDGET_INTERVAL
+
+                if token.type not in TEXT_TOKENS or token.string.isascii():
+                    continue
+
+                if self.nle_comments:
+                    if token.type == tokenize.COMMENT:
                         yield token.start[0], token.start[
-                            1], "NLE001 Non-English text in comment", type(
+                            1], NLE001_COMMENT, type(
                             self)
 
-                elif token.type == tokenize.STRING:
-                    if self._is_docstring(token):
-                        if self._contains_non_english(token.string):
+                    elif token.type == tokenize.STRING:
+                        if self._is_docstring(token):
                             yield token.start[0], token.start[
-                                1], "NLE001 Non-English text in docstring", type(
+                                1], NLE001_DOCSTRING, type(
                                 self)
 
+                if self.nle_homoglyphs:
+                    yield from self._check_homoglyphs(token)
+
+    def _check_homoglyphs(self, token):
+        text = token.string
+        for offset, word, chars in confusables.mixed_script_words(text):
+            # Report the word itself, which may be many lines into a
+            # multi-line string or docstring.
+            newlines = text.count("\n", 0, offset)
+            if newlines:
+                line = token.start[0] + newlines
+                col = offset - text.rfind("\n", 0, offset) - 1
+            else:
+                line, col = token.start[0], token.start[1] + offset
+            yield line, col, confusables.describe(word, chars), type(self)
+
     def _check_strings(self):
-        for node in ast.walk(self.tree):
-            if isinstance(node, ast.Str):
+        countdown = BUDGET_INTERVAL
+        for node in self._walk(self.tree):
+            if self._deadline is not None:
+                countdown -= 1
+                if not countdown:
+                    if self._over_budget():
+                        return
+                    countdown = BUDGET_INTERVAL
+
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
                 if not self._is_docstring_node(node):
-                    if self._contains_non_english(node.s):
-                        yield node.lineno, node.col_offset, "NLE002 Non-English text in string literal", type(
+                    if self._contains_non_english(node.value):
+                        yield node.lineno, node.col_offset, NLE002_STRING, type(
                             self)
 
+    def _walk(self, tree):
+        # Depth-first, so memory grows with nesting depth rather than with
+        # the number of sibling nodes as it does with ``ast.walk``.
+        stack = [ast.iter_child_nodes(tree)]
+        while stack:
+            for node in stack[-1]:
+                yield node
+                stack.append(ast.iter_child_nodes(node))
+                break
+            else:
+                stack.pop()
+
     def _is_docstring(self, token):
         return token.string.startswith('"""') or token.string.startswith("'''")
 
@@ -97,7 +289,4 @@ class NonEnglishChecker:
         return False
 
     def _contains_non_english(self, text):
-        for ch in text:
-            if ord(ch) > 127:
-                return True
-        return False
+        return not text.isascii()
@@ -0,0 +1,99 @@
+# flake8_only_english/config.py
+
+import logging
+import os
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+LOG = logging.getLogger(__name__)
+
+SECTION = "flake8-only-english"
+
+# Directories containing one of these are project roots; parent directories
+# above them are never consulted.
+ROOT_MARKERS = (".git", ".hg")
+
+# Keys of the ``[tool.flake8-only-english]`` section mapped to checker
+# attributes.
+OPTIONS = {
+    "comments": "nle_comments",
+    "strings": "nle_strings",
+    "homoglyphs": "nle_homoglyphs",
+}
+
+_cache = {}
+
+
+def _load(directory):
+    """Return ``(overrides, is_root)`` from a directory's pyproject.toml."""
+    path = os.path.join(directory, "pyproject.toml")
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, ValueError):
+        return {}, False
+
+    tool = data.get("tool")
+    section = tool.get(SECTION) if isinstance(tool, dict) else None
+    if section is None:
+        return {}, False
+    if not isinstance(section, dict):
+        LOG.warning("%s: [tool.%s] is not a table, ignoring it",
+                    path, SECTION)
+        return {}, False
+
+    overrides = {}
+    for key, value in section.items():
+        if key not in OPTIONS and key != "root":
+            continue
+        if not isinstance(value, bool):
+            LOG.warning("%s: %s must be true or false, ignoring %r",
+                        path, key, value)
+            continue
+        if key in OPTIONS:
+            overrides[OPTIONS[key]] = value
+    return overrides, section.get("root") is True
+
+
+def _is_project_root(directory):
+    return any(os.path.exists(os.path.join(directory, marker))
+               for marker in ROOT_MARKERS)
+
+
+def resolve(directory):
+    """Return the checker attribute overrides in effect for a directory.
+
+    Sections in nested ``pyproject.toml`` files override the ones found in
+    parent directories. The walk stops at the project root: a directory
+    holding ``.git`` or ``.hg``, or one whose section sets ``root = true``.
+    Results are cached per directory, so every directory is read at most
+    once.
+    """
+    try:
+        return _cache[directory]
+    except KeyError:
+        pass
+
+    if tomllib is None:
+        config = {}
+    else:
+        overrides, is_root = _load(directory)
+        parent = os.path.dirname(directory)
+        if is_root or parent == directory or _is_project_root(directory):
+            config = {}
+        else:
+            config = dict(resolve(parent))
+        config.update(overrides)
+
+    _cache[directory] = config
+    return config
+
+
+def clear_cache():
+    _cache.clear()
@@ -0,0 +1,58 @@
+# flake8_only_english/confusables.py
+
+import os
+import re
+import unicodedata
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "confusables.tsv")
+
+_WORD = re.compile(r"\w+")
+_table = None
+
+
+def load():
+    """Return the ``{character: ascii_lookalike}`` table, reading it once."""
+    global _table
+    if _table is None:
+        table = {}
+        with open(DATA_FILE, encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("#") or not line.strip():
+                    continue
+                target, chars = line.rstrip("\n").split("\t")
+                for char in chars:
+                    table[char] = target
+        _table = table
+    return _table
+
+
+def mixed_script_words(text):
+    """Yield ``(offset, word, confusables)`` for words hiding lookalikes.
+
+    A word is reported when it contains ASCII letters together with
+    characters that look like ASCII ones. ``offset`` is the index of the
+    word in ``text`` and ``confusables`` lists ``(character, lookalike)``
+    pairs in order of appearance.
+    """
+    table = load()
+    for match in _WORD.finditer(text):
+        word = match.group()
+        if word.isascii():
+            continue
+        if not any(char.isascii() and char.isalpha() for char in word):
+            continue
+        seen = {}
+        for char in word:
+            if char in table and char not in seen:
+                seen[char] = table[char]
+        if seen:
+            yield match.start(), word, list(seen.items())
+
+
+def describe(word, confusables):
+    names = ", ".join(
+        f"U+{ord(char):04X} {unicodedata.name(char, '?')} looks like "
+        f"'{lookalike}'"
+        for char, lookalike in confusables
+    )
+    return f"NLE003 Mixed-script word '{word}': {names}"
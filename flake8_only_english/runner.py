@@ -0,0 +1,264 @@
+# flake8_only_english/runner.py
+
+import argparse
+import ast
+import fnmatch
+import os
+import re
+import sys
+import time
+import tokenize
+
+from . import config
+from .checker import NonEnglishChecker
+
+CONFIG_FILE = "pyproject.toml"
+
+DEFAULT_EXCLUDE = (
+    ".git", ".hg", ".svn", ".tox", ".nox", ".venv", "venv", "__pycache__",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", "build", "dist",
+    "*.egg-info",
+)
+
+
+class _OptionAdapter:
+    """Expose ``add_option`` so the checker can register its flake8 options."""
+
+    def __init__(self, parser):
+        self.parser = parser
+
+    def add_option(self, *args, **kwargs):
+        self.parser.add_argument(*args, **kwargs)
+
+
+def _exclude_matcher(exclude):
+    """Return a predicate telling whether a file or directory name is excluded.
+
+    Literal names are looked up in a set and glob patterns are compiled into
+    a single regex, so each directory entry costs one lookup and at most one
+    match.
+    """
+    literals = frozenset(p for p in exclude if not _is_glob(p))
+    globs = [fnmatch.translate(p) for p in exclude if _is_glob(p)]
+    match = re.compile("|".join(globs)).match if globs else None
+
+    def is_excluded(name):
+        return name in literals or (match is not None and match(name))
+
+    return is_excluded
+
+
+def _is_glob(pattern):
+    return any(char in pattern for char in "*?[")
+
+
+def _positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0: {value}")
+    return number
+
+
+def snapshot(paths, exclude=DEFAULT_EXCLUDE):
+    """Return ``{path: (mtime_ns, size)}`` for every Python file under paths.
+
+    ``pyproject.toml`` files are included as well, since they carry
+    per-directory configuration. Excluded directories are pruned before
+    descending into them.
+    """
+    is_excluded = _exclude_matcher(exclude)
+    stats = {}
+    stack = []
+    for path in paths:
+        if os.path.isdir(path):
+            stack.append(path)
+        elif os.path.isfile(path):
+            st = os.stat(path)
+            stats[path] = (st.st_mtime_ns, st.st_size)
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if is_excluded(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif (entry.name.endswith(".py")
+                          or entry.name == CONFIG_FILE) and entry.is_file():
+                        st = entry.stat()
+                        stats[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return stats
+
+
+def check_file(path):
+    """Run the checker on a single file.
+
+    Return its violations and the reason the scan was degraded, if it was.
+    Files that cannot be parsed are reported as ``E999`` like flake8 does,
+    and files that vanish while being checked are skipped. ``None`` means
+    the file changed while it was being checked and should be retried.
+    """
+    try:
+        with open(path, "rb") as f:
+            source = f.read()
+    except OSError:
+        return [], None
+
+    try:
+        tree = ast.parse(source, filename=path)
+    except SyntaxError as e:
+        return [(e.lineno or 1, max((e.offset or 1) - 1, 0),
+                 f"E999 SyntaxError: {e.msg}")], None
+    except ValueError as e:
+        return [(1, 0, f"E999 {type(e).__name__}: {e}")], None
+
+    checker = NonEnglishChecker(tree=tree, filename=path)
+    try:
+        results = sorted(
+            (line, col, message) for line, col, message, _ in checker.run()
+        )
+    except OSError:
+        return [], None
+    except (SyntaxError, tokenize.TokenError):
+        return None
+    return results, checker.degraded
+
+
+class Runner:
+    """Keep per-file stats and results so only changed files are re-checked."""
+
+    def __init__(self, paths, exclude=DEFAULT_EXCLUDE):
+        self.paths = list(paths)
+        self.exclude = tuple(exclude)
+        self.stats = {}
+        self.results = {}
+        self.degraded = {}
+
+    def refresh(self):
+        """Re-check files whose stat changed and return (changed, removed)."""
+        current = snapshot(self.paths, self.exclude)
+        changed = sorted(
+            path for path, stat in current.items()
+            if self.stats.get(path) != stat
+        )
+        removed = sorted(path for path in self.stats if path not in current)
+
+        if any(os.path.basename(path) == CONFIG_FILE
+               for path in changed + removed):
+            config.clear_cache()
+            changed = sorted(current)
+        changed = [path for path in changed
+                   if os.path.basename(path) != CONFIG_FILE]
+        removed = [path for path in removed
+                   if os.path.basename(path) != CONFIG_FILE]
+
+        retry = []
+        for path in changed:
+            outcome = check_file(path)
+            if outcome is None:
+                retry.append(path)
+                continue
+            self.results[path], reason = outcome
+            if reason:
+                self.degraded[path] = reason
+            else:
+                self.degraded.pop(path, None)
+        for path in removed:
+            self.results.pop(path, None)
+            self.degraded.pop(path, None)
+
+        # Keep the previous stat of files caught mid-write so the next poll
+        # checks them again.
+        for path in retry:
+            if path in self.stats:
+                current[path] = self.stats[path]
+            else:
+                del current[path]
+        changed = [path for path in changed if path not in retry]
+
+        self.stats = current
+        return changed, removed
+
+    def violation_count(self):
+        return sum(len(results) for results in self.results.values())
+
+    def report(self, paths, stream=None):
+        stream = stream or sys.stdout
+        for path in paths:
+            for line, col, message in self.results.get(path, ()):
+                stream.write(f"{path}:{line}:{col + 1}: {message}\n")
+        stream.flush()
+
+    def report_degraded(self, paths, stream=None):
+        stream = stream or sys.stderr
+        for path in paths:
+            if path in self.degraded:
+                stream.write(f"{path}: degraded, {self.degraded[path]}\n")
+        stream.flush()
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(
+        prog="flake8-only-english",
+        description="Check Python files for non-English text.",
+    )
+    parser.add_argument("paths", nargs="*", default=["."])
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-check files whenever they change."
+    )
+    parser.add_argument(
+        "--interval",
+        type=_positive_float,
+        default=1.0,
+        help="Polling interval in seconds for --watch (default: 1.0)."
+    )
+    parser.add_argument(
+        "--exclude",
+        default=",".join(DEFAULT_EXCLUDE),
+        help="Comma-separated file or directory name patterns to skip."
+    )
+    NonEnglishChecker.add_options(_OptionAdapter(parser))
+    return parser
+
+
+def main(argv=None):
+    options = _build_parser().parse_args(argv)
+    NonEnglishChecker.parse_options(options)
+    exclude = [p.strip() for p in options.exclude.split(",") if p.strip()]
+
+    missing = [path for path in options.paths if not os.path.exists(path)]
+    for path in missing:
+        sys.stdout.write(f"{path}:0:1: E902 FileNotFoundError: "
+                         f"No such file or directory\n")
+    sys.stdout.flush()
+
+    runner = Runner(options.paths, exclude)
+    changed, _ = runner.refresh()
+    runner.report(changed)
+    runner.report_degraded(changed)
+
+    if not options.watch:
+        return 1 if missing or runner.violation_count() else 0
+
+    try:
+        while True:
+            time.sleep(options.interval)
+            changed, removed = runner.refresh()
+            if changed or removed:
+                runner.report(changed)
+                runner.report_degraded(changed)
+                sys.stderr.write(
+                    f"{len(changed)} file(s) re-checked, "
+                    f"{runner.violation_count()} violation(s) total\n"
+                )
+    except KeyboardInterrupt:
+        return 0
@@ -0,0 +1,56 @@
+# scripts/build_confusables.py
+
+"""Build ``flake8_only_english/confusables.tsv`` from Unicode confusables.txt.
+
+Usage::
+
+    python scripts/build_confusables.py confusables.txt
+
+Only single non-ASCII characters that are confusable with a single ASCII
+letter or digit are kept. The output holds one line per ASCII character,
+followed by a tab and every character that looks like it.
+"""
+import os
+import sys
+
+OUTPUT = os.path.join(os.path.dirname(__file__), os.pardir,
+                      "flake8_only_english", "confusables.tsv")
+
+
+def parse(lines):
+    table = {}
+    for line in lines:
+        line = line.split("#", 1)[0].strip().lstrip("﻿")
+        if not line:
+            continue
+        fields = [field.strip() for field in line.split(";")]
+        source, target = fields[0].split(), fields[1].split()
+        if len(source) != 1 or len(target) != 1:
+            continue
+        source, target = chr(int(source[0], 16)), chr(int(target[0], 16))
+        if source.isascii() or not (target.isascii() and target.isalnum()):
+            continue
+        table.setdefault(target, set()).add(source)
+    return table
+
+
+def write(table, path, source):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# Generated by scripts/build_confusables.py from {source}\n")
+        for target in sorted(table):
+            f.write(f"{target}\t{''.join(sorted(table[target]))}\n")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        sys.stderr.write(__doc__)
+        return 2
+    with open(argv[0], encoding="utf-8") as f:
+        table = parse(f)
+    write(table, OUTPUT, os.path.basename(argv[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
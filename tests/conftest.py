@@ -1,4 +1,9 @@
 # tests/conftest.py
+import ast
+import contextlib
+import os
+import tempfile
+
 import pytest
 
 from flake8_only_english.checker import NonEnglishChecker
@@ -8,5 +13,30 @@ from flake8_only_english.checker import NonEnglishChecker
 def reset_flags():
     NonEnglishChecker.nle_comments = True
     NonEnglishChecker.nle_strings = False
+    NonEnglishChecker.nle_homoglyphs = True
+    NonEnglishChecker.nle_time_budget_ms = 0
+    NonEnglishChecker.nle_max_bytes = 0
+    NonEnglishChecker.nle_cli_options = frozenset()
     NonEnglishChecker.nle001_enabled = True
     NonEnglishChecker.nle002_enabled = True
+
+
+def write(path, text):
+    """Write text to ``path``, creating parent directories as needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@contextlib.contextmanager
+def python_file(code):
+    """Write code to a temporary .py file and yield ``(filename, tree)``."""
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False,
+                                     encoding="utf-8") as tmp:
+        tmp.write(code)
+        tmp_name = tmp.name
+
+    try:
+        yield tmp_name, ast.parse(code, filename=tmp_name)
+    finally:
+        os.remove(tmp_name)
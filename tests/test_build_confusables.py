@@ -0,0 +1,49 @@
+# tests/test_build_confusables.py
+import importlib.util
+import os
+
+from flake8_only_english import confusables
+
+SCRIPT = os.path.join(os.path.dirname(__file__), os.pardir, "scripts",
+                      "build_confusables.py")
+
+# Excerpt of Unicode's confusables.txt, including its BOM-prefixed header.
+CONFUSABLES_TXT = """\
+﻿# confusables.txt
+# Date: 2023-08-11, 17:46:40 GMT
+# © 2023 Unicode®, Inc.
+
+0430 ;\t0061 ;\tMA\t# ( а → a ) CYRILLIC SMALL LETTER A → LATIN SMALL LETTER A\t# \n\
+03BF ;\t006F ;\tMA\t# ( ο → o ) GREEK SMALL LETTER OMICRON → LATIN SMALL LETTER O\t# \n\
+FF4F ;\t006F ;\tMA\t# ( ｏ → o ) FULLWIDTH LATIN SMALL LETTER O → LATIN SMALL LETTER O\t# →ｏ→\n\
+2488 ;\t0031 002E ;\tMA\t# ( ⒈ → 1. ) DIGIT ONE FULL STOP → DIGIT ONE, FULL STOP\t# \n\
+0031 ;\t006C ;\tMA\t# ( 1 → l ) DIGIT ONE → LATIN SMALL LETTER L\t# \n\
+2010 ;\t002D ;\tMA\t# ( ‐ → - ) HYPHEN → HYPHEN-MINUS\t# \n\
+"""
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("build_confusables", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_parse_keeps_single_non_ascii_lookalikes():
+    build = load_script()
+    table = build.parse(CONFUSABLES_TXT.splitlines(keepends=True))
+
+    # The multi-codepoint target, the ASCII source and the punctuation
+    # target are all dropped.
+    assert table == {"a": {"а"}, "o": {"ο", "ｏ"}}
+
+
+def test_written_table_loads(tmp_path, monkeypatch):
+    build = load_script()
+    path = str(tmp_path / "confusables.tsv")
+    build.write(build.parse(CONFUSABLES_TXT.splitlines()), path,
+                "confusables.txt")
+
+    monkeypatch.setattr(confusables, "DATA_FILE", path)
+    monkeypatch.setattr(confusables, "_table", None)
+    assert confusables.load() == {"а": "a", "ο": "o", "ｏ": "o"}
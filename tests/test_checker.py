@@ -3,6 +3,7 @@ import ast
 import os
 import tempfile
 import textwrap
+import types
 
 from flake8_only_english.checker import NonEnglishChecker
 
@@ -566,6 +567,8 @@ def test_both_nle_enabled_explicitly():
     NonEnglishChecker.parse_options(
         type("Options", (),
              {"nle_comments": True, "nle_strings": True,
+              "nle_homoglyphs": None, "nle_time_budget_ms": None,
+              "nle_max_bytes": None,
               "disable_nle001": False, "disable_nle002": False})()
     )
 
@@ -588,6 +591,8 @@ def test_disable_flags_override():
     NonEnglishChecker.parse_options(
         type("Options", (),
              {"nle_comments": True, "nle_strings": True,
+              "nle_homoglyphs": None, "nle_time_budget_ms": None,
+              "nle_max_bytes": None,
               "disable_nle001": True, "disable_nle002": True})()
     )
 
@@ -609,6 +614,8 @@ def test_disable_flags_have_priority_over_enable():
     NonEnglishChecker.parse_options(
         type("Options", (),
              {"nle_comments": True, "nle_strings": True,
+              "nle_homoglyphs": None, "nle_time_budget_ms": None,
+              "nle_max_bytes": None,
               "disable_nle001": True, "disable_nle002": False})()
     )
 
@@ -630,3 +637,192 @@ def test_default_behavior():
     results = run_checker(code, enable_strings=False)
     assert any("NLE001" in r[2] for r in results)
     assert all("NLE002" not in r[2] for r in results)
+
+
+def test_homoglyph_in_comment():
+    code = '# check the pаssword\n'
+    results = run_checker(code)
+    assert [r[2] for r in results] == [
+        "NLE001 Non-English text in comment",
+        "NLE003 Mixed-script word 'pаssword': "
+        "U+0430 CYRILLIC SMALL LETTER A looks like 'a'",
+    ]
+
+
+def test_homoglyph_in_identifier():
+    code = 'def gеt_user():\n    return 42\n'
+    results = run_checker(code, disable_comments=True)
+    assert len(results) == 1
+    assert results[0][:2] == (1, 4)
+    assert results[0][2].startswith("NLE003 Mixed-script word 'gеt_user'")
+
+
+def test_homoglyph_reported_at_word_in_comment():
+    code = 'x = 1  # check the pаssword\n'
+    results = run_checker(code, disable_comments=True)
+    assert [r[:2] for r in results] == [(1, 19)]
+
+
+def test_homoglyph_reported_at_word_in_multiline_docstring():
+    code = textwrap.dedent(
+        '''
+        def foo():
+            """Return the user.
+
+            Never log the
+                pаssword here.
+            """
+        '''
+    )
+    results = run_checker(code, disable_comments=True)
+    assert [r[:2] for r in results] == [(6, 8)]
+    assert "'pаssword'" in results[0][2]
+
+
+def test_homoglyph_in_string_names_all_confusables():
+    code = 'x = "Ηοme"\n'
+    results = run_checker(code, disable_comments=True)
+    assert len(results) == 1
+    assert "U+0397 GREEK CAPITAL LETTER ETA looks like 'H'" in results[0][2]
+    assert "U+03BF GREEK SMALL LETTER OMICRON looks like 'o'" in results[0][2]
+
+
+def test_single_script_word_is_not_homoglyph():
+    code = '# Привет мир\nx = "Grüß Gott"\n'
+    results = run_checker(code)
+    assert all("NLE003" not in r[2] for r in results)
+
+
+def test_homoglyph_check_disabled():
+    code = '# check the pаssword\n'
+    NonEnglishChecker.nle_homoglyphs = False
+    results = run_checker(code)
+    assert [r[2] for r in results] == ["NLE001 Non-English text in comment"]
+
+
+def test_max_bytes_degrades_to_presence_check():
+    code = '# Привет\nx = 1\n# мир\n'
+    NonEnglishChecker.nle_max_bytes = 10
+    results = run_checker(code)
+    assert [r[:3] for r in results] == [
+        (1, 0, "NLE004 Non-English text in file too large for a full scan, "
+               "skipped NLE001, NLE003")
+    ]
+
+
+def test_max_bytes_degraded_english_file():
+    code = '# English only\nx = 1\n'
+    NonEnglishChecker.nle_max_bytes = 10
+    results = run_checker(code)
+    assert results == []
+
+
+def test_max_bytes_degraded_file_with_bom():
+    with tempfile.NamedTemporaryFile("wb", suffix=".py",
+                                     delete=False) as tmp:
+        tmp.write(b"\xef\xbb\xbf# English only\nx = 1\n")
+        tmp_name = tmp.name
+
+    try:
+        with open(tmp_name, "rb") as f:
+            tree = ast.parse(f.read(), filename=tmp_name)
+        NonEnglishChecker.nle_max_bytes = 10
+        checker = NonEnglishChecker(tree=tree, filename=tmp_name)
+        assert list(checker.run()) == []
+    finally:
+        os.remove(tmp_name)
+
+
+def test_max_bytes_presence_check_reads_in_chunks(monkeypatch):
+    monkeypatch.setattr("flake8_only_english.checker.CHUNK_SIZE", 4)
+    code = '# English only\n' * 5 + '# мир\n'
+    NonEnglishChecker.nle_max_bytes = 10
+    results = run_checker(code)
+    assert [r[2][:6] for r in results] == ["NLE004"]
+
+
+def test_max_bytes_not_exceeded():
+    code = '# Привет\n'
+    NonEnglishChecker.nle_max_bytes = 1024
+    results = run_checker(code)
+    assert [r[2] for r in results] == ["NLE001 Non-English text in comment"]
+
+
+def test_max_bytes_names_only_enabled_checks():
+    code = 'x = "привет"\n' * 10
+    NonEnglishChecker.nle_max_bytes = 10
+    NonEnglishChecker.nle_homoglyphs = False
+    results = run_checker(code, disable_comments=True, enable_strings=True)
+    assert [r[2] for r in results] == [
+        "NLE004 Non-English text in file too large for a full scan, "
+        "skipped NLE002"
+    ]
+
+
+def test_max_bytes_with_every_check_disabled():
+    code = 'x = "привет"\n' * 10
+    NonEnglishChecker.nle_max_bytes = 10
+    NonEnglishChecker.nle_homoglyphs = False
+    results = run_checker(code, disable_comments=True, enable_strings=False)
+    assert results == []
+
+
+def test_negative_limits_are_disabled():
+    NonEnglishChecker.parse_options(
+        type("Options", (),
+             {"nle_comments": None, "nle_strings": None,
+              "nle_homoglyphs": None, "nle_time_budget_ms": -1,
+              "nle_max_bytes": -1})()
+    )
+    assert NonEnglishChecker.nle_time_budget_ms == 0
+    assert NonEnglishChecker.nle_max_bytes == 0
+
+    results = run_checker('# Привет\n')
+    assert [r[2] for r in results] == ["NLE001 Non-English text in comment"]
+
+
+def fake_clock(monkeypatch):
+    # Every call advances the clock by one second.
+    # Only the checker's reference to ``time`` is replaced, so pytest and
+    # logging keep the real clock.
+    clock = iter(range(0, 1_000_000))
+    monkeypatch.setattr("flake8_only_english.checker.time",
+                        types.SimpleNamespace(monotonic=lambda: next(clock)))
+
+
+def test_time_budget_degrades_to_presence_check(monkeypatch, caplog):
+    fake_clock(monkeypatch)
+    code = '# Привет\n' + "x = 1\n" * 300
+    NonEnglishChecker.nle_time_budget_ms = 2000
+    results = run_checker(code, enable_strings=True)
+    assert [r[2] for r in results] == [
+        "NLE004 Non-English text in file too large for a full scan, "
+        "skipped NLE001, NLE002, NLE003"
+    ]
+    assert "exceeded --nle-time-budget-ms=2000" in caplog.text
+
+
+def test_time_budget_cuts_single_line_file_short(monkeypatch, caplog):
+    fake_clock(monkeypatch)
+    code = "x = [" + "1, " * 1000 + "]  # Привет\n"
+    NonEnglishChecker.nle_time_budget_ms = 2000
+    results = run_checker(code)
+    assert [r[2][:6] for r in results] == ["NLE004"]
+    assert "exceeded --nle-time-budget-ms=2000" in caplog.text
+
+
+def test_time_budget_not_exceeded(monkeypatch):
+    NonEnglishChecker.nle_time_budget_ms = 60_000
+    results = run_checker('# Привет\n' + "x = 1\n" * 300)
+    assert [r[2] for r in results] == ["NLE001 Non-English text in comment"]
+
+
+def test_confusables_table_maps_to_ascii():
+    from flake8_only_english import confusables
+
+    table = confusables.load()
+    assert table["а"] == "a"
+    for char, lookalike in table.items():
+        assert len(char) == 1 and not char.isascii()
+        assert len(lookalike) == 1 and lookalike.isascii()
+        assert lookalike.isalnum()
@@ -0,0 +1,128 @@
+# tests/test_config.py
+import ast
+import os
+
+from conftest import write
+from flake8_only_english import config
+from flake8_only_english.checker import NonEnglishChecker
+from flake8_only_english.runner import Runner
+
+
+def check(path):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    return list(NonEnglishChecker(tree=tree, filename=path).run())
+
+
+def test_nested_sections_override_parents(tmp_path):
+    write(tmp_path / "pyproject.toml",
+          "[tool.flake8-only-english]\ncomments = true\nstrings = true\n")
+    write(tmp_path / "locales" / "pyproject.toml",
+          "[tool.flake8-only-english]\nstrings = false\n")
+    (tmp_path / "locales" / "ru").mkdir()
+    (tmp_path / "core").mkdir()
+
+    assert config.resolve(str(tmp_path / "core")) == {
+        "nle_comments": True, "nle_strings": True,
+    }
+    assert config.resolve(str(tmp_path / "locales" / "ru")) == {
+        "nle_comments": True, "nle_strings": False,
+    }
+
+
+def test_resolution_is_cached(tmp_path, monkeypatch):
+    write(tmp_path / "pyproject.toml",
+          "[tool.flake8-only-english]\nstrings = true\n")
+    directory = str(tmp_path)
+    first = config.resolve(directory)
+
+    loads = []
+    monkeypatch.setattr(config, "_load", loads.append)
+    assert config.resolve(directory) is first
+    assert loads == []
+
+
+def test_invalid_pyproject_is_ignored(tmp_path):
+    write(tmp_path / "pyproject.toml", "[tool.flake8-only-english\n")
+
+    assert config.resolve(str(tmp_path)) == {}
+
+
+def test_checker_applies_directory_config(tmp_path):
+    write(tmp_path / "core" / "pyproject.toml",
+          "[tool.flake8-only-english]\nstrings = true\n")
+    strict = write(tmp_path / "core" / "mod.py", 'x = "Привет"\n')
+    relaxed = write(tmp_path / "locales" / "mod.py", 'x = "Привет"\n')
+
+    assert [r[2] for r in check(strict)] == [
+        "NLE002 Non-English text in string literal"
+    ]
+    assert check(relaxed) == []
+
+
+def test_runner_rechecks_tree_when_config_changes(tmp_path):
+    path = write(tmp_path / "mod.py", 'x = "Привет"\n')
+    watcher = Runner([str(tmp_path)])
+    watcher.refresh()
+    assert watcher.results == {path: []}
+
+    write(tmp_path / "pyproject.toml",
+          "[tool.flake8-only-english]\nstrings = true\n")
+    changed, removed = watcher.refresh()
+    assert changed == [path]
+    assert watcher.violation_count() == 1
+
+    os.remove(tmp_path / "pyproject.toml")
+    changed, removed = watcher.refresh()
+    assert (changed, removed) == ([path], [])
+    assert watcher.violation_count() == 0
+
+
+def test_malformed_sections_are_ignored(tmp_path):
+    for index, text in enumerate([
+        "[tool]\nflake8-only-english = 1\n",
+        'tool = "x"\n',
+        '[tool.flake8-only-english]\nstrings = "false"\ncomments = false\n',
+    ]):
+        directory = tmp_path / str(index)
+        write(directory / "pyproject.toml", text)
+        expected = {"nle_comments": False} if index == 2 else {}
+        assert config.resolve(str(directory)) == expected
+
+
+def test_resolution_stops_at_project_root(tmp_path, monkeypatch):
+    write(tmp_path / "pyproject.toml",
+          "[tool.flake8-only-english]\nstrings = true\n")
+    (tmp_path / "vcs" / ".git").mkdir(parents=True)
+    write(tmp_path / "marked" / "pyproject.toml",
+          "[tool.flake8-only-english]\nroot = true\ncomments = false\n")
+    write(tmp_path / "repo" / "pyproject.toml",
+          "[tool.flake8-only-english]\ncomments = false\n")
+    (tmp_path / "repo" / ".git").mkdir()
+    (tmp_path / "repo" / "core").mkdir()
+
+    assert config.resolve(str(tmp_path / "vcs")) == {}
+    assert config.resolve(str(tmp_path / "marked")) == {
+        "nle_comments": False,
+    }
+
+    # The working directory is not a root, so running from a subdirectory
+    # keeps the repository-wide policy.
+    monkeypatch.chdir(tmp_path / "repo" / "core")
+    assert config.resolve(str(tmp_path / "repo" / "core")) == {
+        "nle_comments": False,
+    }
+
+
+def test_command_line_options_win_over_config(tmp_path):
+    write(tmp_path / "pyproject.toml",
+          "[tool.flake8-only-english]\ncomments = true\n")
+    path = write(tmp_path / "mod.py", "# Привет\n")
+
+    NonEnglishChecker.parse_options(
+        type("Options", (), {"nle_comments": False, "nle_strings": None,
+                             "nle_homoglyphs": None,
+                             "nle_time_budget_ms": None,
+                             "nle_max_bytes": None})()
+    )
+    assert check(path) == []
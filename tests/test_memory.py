@@ -0,0 +1,178 @@
+# tests/test_memory.py
+import gc
+import io
+import tokenize
+import tracemalloc
+
+import pytest
+
+from conftest import python_file
+from flake8_only_english import checker as checker_module
+from flake8_only_english.checker import NonEnglishChecker
+
+SIZES = {"small": 20, "medium": 200, "huge": 1_000}
+
+# Upper bounds on traced allocations. Peak memory while streaming results
+# must not grow with the number of tokens, clean tokens and AST nodes must
+# not allocate at all while the checker handles them, and every kept
+# violation may only cost its result tuple and list slot, never a freshly
+# built message. A small fixed overhead covers interpreter caches touched
+# on the way.
+MAX_FIXED_BYTES = 4096
+MAX_BYTES_PER_TOKEN = 1
+MAX_BYTES_PER_VIOLATION = 128
+
+
+def clean_source(lines):
+    return "".join(
+        f'value_{i} = compute("value {i}", {i})  # English comment\n'
+        for i in range(lines)
+    )
+
+
+def non_english_source(lines):
+    return "".join(
+        f'value_{i} = compute("значение {i}", {i})  # комментарий\n'
+        for i in range(lines)
+    )
+
+
+def count_tokens(code):
+    return sum(1 for _ in tokenize.generate_tokens(io.StringIO(code).readline))
+
+
+def measure(code, keep_results):
+    """Return (retained, peak, violations) traced while running the checker."""
+    with python_file(code) as (filename, tree):
+        checker = NonEnglishChecker(tree=tree, filename=filename)
+        # Warm up lazily initialised state such as the config cache.
+        list(NonEnglishChecker(tree=tree, filename=filename).run())
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            if keep_results:
+                results = list(checker.run())
+                violations = len(results)
+            else:
+                violations = sum(1 for _ in checker.run())
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return current - before, peak - before, violations
+
+
+def traced(items, excess):
+    """Yield items, recording what is allocated while each one is handled.
+
+    The previous item is kept alive until the consumer has moved on, so
+    releasing it cannot hide allocations made for the next one.
+    """
+    previous = None
+    for item in items:
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        yield item
+        _, peak = tracemalloc.get_traced_memory()
+        excess.append(peak - start)
+        previous = item  # noqa: F841
+
+
+def measure_per_item(code, monkeypatch):
+    """Return bytes allocated while handling each token and AST node."""
+    tokens, nodes = [], []
+    tokenize_file = tokenize.tokenize
+    walk = NonEnglishChecker._walk
+    monkeypatch.setattr(checker_module.tokenize, "tokenize",
+                        lambda readline: traced(tokenize_file(readline),
+                                                tokens))
+    monkeypatch.setattr(NonEnglishChecker, "_walk",
+                        lambda self, tree: traced(walk(self, tree), nodes))
+
+    with python_file(code) as (filename, tree):
+        list(NonEnglishChecker(tree=tree, filename=filename).run())
+        tokens.clear()
+        nodes.clear()
+        gc.collect()
+
+        tracemalloc.start()
+        try:
+            for _ in NonEnglishChecker(tree=tree, filename=filename).run():
+                pass
+        finally:
+            tracemalloc.stop()
+
+    return tokens, nodes
+
+
+@pytest.fixture(autouse=True)
+def enable_all_checks():
+    NonEnglishChecker.nle_comments = True
+    NonEnglishChecker.nle_strings = True
+    NonEnglishChecker.nle_homoglyphs = True
+
+
+@pytest.mark.parametrize("make_source", [clean_source, non_english_source])
+def test_peak_does_not_grow_per_token(make_source):
+    small = make_source(SIZES["small"])
+    _, small_peak, _ = measure(small, keep_results=False)
+
+    for size in ("medium", "huge"):
+        code = make_source(SIZES[size])
+        _, peak, _ = measure(code, keep_results=False)
+        extra_tokens = count_tokens(code) - count_tokens(small)
+        limit = MAX_FIXED_BYTES + MAX_BYTES_PER_TOKEN * extra_tokens
+        assert peak - small_peak <= limit, (
+            f"{size}: peak grew by {peak - small_peak} bytes "
+            f"for {extra_tokens} extra tokens"
+        )
+
+
+@pytest.mark.parametrize("size", sorted(SIZES))
+def test_clean_input_retains_nothing_per_token(size):
+    code = clean_source(SIZES[size])
+    retained, _, violations = measure(code, keep_results=False)
+    assert violations == 0
+    assert retained <= MAX_FIXED_BYTES + MAX_BYTES_PER_TOKEN * count_tokens(
+        code)
+
+
+@pytest.mark.skipif(not hasattr(tracemalloc, "reset_peak"),
+                    reason="tracemalloc.reset_peak() needs Python 3.9+")
+@pytest.mark.parametrize("size", ["small", "medium"])
+def test_clean_tokens_and_nodes_allocate_nothing(size, monkeypatch):
+    code = clean_source(SIZES[size])
+    tokens, nodes = measure_per_item(code, monkeypatch)
+    # tokenize.tokenize() adds an ENCODING token to the text tokens.
+    assert len(tokens) == count_tokens(code) + 1
+    assert nodes
+    assert sum(tokens) <= MAX_FIXED_BYTES, (
+        f"{sum(tokens)} bytes allocated over {len(tokens)} tokens"
+    )
+    assert sum(nodes) <= MAX_FIXED_BYTES, (
+        f"{sum(nodes)} bytes allocated over {len(nodes)} nodes"
+    )
+
+
+@pytest.mark.parametrize("size", sorted(SIZES))
+def test_allocations_per_violation(size):
+    retained, _, violations = measure(non_english_source(SIZES[size]),
+                                      keep_results=True)
+    assert violations == 2 * SIZES[size]
+    assert retained <= MAX_FIXED_BYTES + MAX_BYTES_PER_VIOLATION * violations, (
+        f"{retained / violations:.1f} bytes per violation"
+    )
+
+
+def test_messages_are_shared_constants():
+    code = non_english_source(3)
+    with python_file(code) as (filename, tree):
+        results = list(NonEnglishChecker(tree=tree, filename=filename).run())
+
+    messages = {}
+    for _, _, message, _ in results:
+        messages.setdefault(message, set()).add(id(message))
+    assert len(messages) == 2
+    assert all(len(ids) == 1 for ids in messages.values())
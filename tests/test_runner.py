@@ -0,0 +1,150 @@
+# tests/test_runner.py
+import os
+
+import pytest
+
+from conftest import write
+from flake8_only_english import runner
+from flake8_only_english.runner import Runner, main, snapshot
+
+
+def test_snapshot_prunes_excluded_directories(tmp_path):
+    kept = write(tmp_path / "pkg" / "mod.py", "x = 1\n")
+    write(tmp_path / ".venv" / "lib" / "site.py", "x = 1\n")
+    write(tmp_path / "pkg" / "__pycache__" / "mod.py", "x = 1\n")
+    write(tmp_path / "pkg" / "notes.txt", "text\n")
+
+    assert list(snapshot([str(tmp_path)])) == [kept]
+
+
+def test_refresh_rechecks_only_changed_files(tmp_path, monkeypatch):
+    first = write(tmp_path / "a.py", "# English\n")
+    second = write(tmp_path / "b.py", "# Привет\n")
+
+    checked = []
+    original = runner.check_file
+
+    def counting_check_file(path):
+        checked.append(path)
+        return original(path)
+
+    monkeypatch.setattr(runner, "check_file", counting_check_file)
+
+    watcher = Runner([str(tmp_path)])
+    changed, removed = watcher.refresh()
+    assert sorted(checked) == sorted([first, second])
+    assert watcher.violation_count() == 1
+
+    checked.clear()
+    assert watcher.refresh() == ([], [])
+    assert checked == []
+
+    write(tmp_path / "a.py", "# Hola mundo, señor\n")
+    os.utime(first, ns=(0, 0))
+    changed, removed = watcher.refresh()
+    assert changed == checked == [first]
+    assert watcher.violation_count() == 2
+
+    os.remove(second)
+    changed, removed = watcher.refresh()
+    assert (changed, removed) == ([], [second])
+    assert watcher.violation_count() == 1
+
+
+def test_main_reports_violations(tmp_path, capsys):
+    path = write(tmp_path / "mod.py", "# Привет\nx = 1\n")
+
+    assert main([str(tmp_path)]) == 1
+    assert capsys.readouterr().out == (
+        f"{path}:1:1: NLE001 Non-English text in comment\n"
+    )
+
+
+def test_main_clean_tree(tmp_path):
+    write(tmp_path / "mod.py", "# English\nx = 1\n")
+
+    assert main([str(tmp_path)]) == 0
+
+
+def test_main_reports_degraded_files(tmp_path, capsys):
+    path = write(tmp_path / "big.py", "# Привет\n" * 10)
+
+    assert main([str(tmp_path), "--nle-max-bytes", "20"]) == 1
+    out, err = capsys.readouterr()
+    assert out == (
+        f"{path}:1:1: NLE004 Non-English text in file too large for a full "
+        "scan, skipped NLE001, NLE003\n"
+    )
+    assert f"{path}: degraded, " in err
+
+
+def test_main_reports_unparsable_file(tmp_path, capsys):
+    path = write(tmp_path / "broken.py", "# Привет\ndef f(:\n")
+
+    assert main([str(tmp_path)]) == 1
+    out = capsys.readouterr().out
+    assert out.startswith(f"{path}:2:")
+    assert "E999 SyntaxError" in out
+
+
+def test_file_removed_during_check_is_skipped(tmp_path, monkeypatch):
+    path = write(tmp_path / "mod.py", "# Привет\n")
+    original = runner.NonEnglishChecker.run
+
+    def run_after_removal(self):
+        os.remove(path)
+        return original(self)
+
+    monkeypatch.setattr(runner.NonEnglishChecker, "run", run_after_removal)
+
+    watcher = Runner([str(tmp_path)])
+    assert watcher.refresh() == ([path], [])
+    assert watcher.results == {path: []}
+
+
+def test_file_changed_during_check_is_retried(tmp_path, monkeypatch):
+    path = write(tmp_path / "mod.py", "# Привет\n")
+    original = runner.NonEnglishChecker.run
+
+    def run_after_partial_write(self):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('x = """unterminated\n')
+        return original(self)
+
+    monkeypatch.setattr(runner.NonEnglishChecker, "run",
+                        run_after_partial_write)
+
+    watcher = Runner([str(tmp_path)])
+    assert watcher.refresh() == ([], [])
+    assert watcher.stats == {}
+
+    monkeypatch.setattr(runner.NonEnglishChecker, "run", original)
+    assert watcher.refresh() == ([path], [])
+    assert [r[2][:4] for r in watcher.results[path]] == ["E999"]
+
+
+def test_snapshot_excludes_glob_and_literal_patterns(tmp_path):
+    kept = write(tmp_path / "pkg" / "mod.py", "x = 1\n")
+    write(tmp_path / "pkg.egg-info" / "mod.py", "x = 1\n")
+    write(tmp_path / "gen_1" / "mod.py", "x = 1\n")
+    write(tmp_path / "vendor" / "mod.py", "x = 1\n")
+
+    exclude = ["*.egg-info", "gen_?", "vendor"]
+    assert list(snapshot([str(tmp_path)], exclude)) == [kept]
+
+
+def test_main_reports_missing_paths(tmp_path, capsys):
+    write(tmp_path / "mod.py", "# English\n")
+    missing = str(tmp_path / "typo")
+
+    assert main([str(tmp_path), missing]) == 1
+    assert capsys.readouterr().out == (
+        f"{missing}:0:1: E902 FileNotFoundError: No such file or directory\n"
+    )
+
+
+def test_main_rejects_non_positive_interval(tmp_path):
+    for interval in ("0", "-1"):
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tmp_path), "--watch", "--interval", interval])
+        assert exc_info.value.code == 2